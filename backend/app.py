@@ -22,6 +22,42 @@ from database import get_model_history, get_cached_result, get_connection
 
 app = Flask(__name__)
 
+# Serialize jsonify() responses with orjson when it is installed
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """
+        jsonify() backed by orjson. Datetimes and dataclasses are passed through to
+        Flask's default hook so they keep the stdlib provider's format. Output that
+        orjson cannot write the way the stdlib would (non-ASCII text while ensure_ascii
+        is on, integers beyond 64 bits) falls back to the stdlib encoder. Finite floats
+        may be spelled differently (1e-05 vs 0.00001) but decode to the same value;
+        NaN and Infinity are written as null.
+        """
+        OPTIONS = (
+            orjson.OPT_SORT_KEYS
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+
+        def dumps(self, obj, **kwargs):
+            option = self.OPTIONS | (orjson.OPT_INDENT_2 if kwargs.get("indent") else 0)
+            try:
+                data = orjson.dumps(obj, default=self.default, option=option)
+            except orjson.JSONEncodeError:
+                return super().dumps(obj, **kwargs)
+            # orjson always writes raw UTF-8; only the stdlib can \u-escape it
+            if kwargs.get("ensure_ascii", self.ensure_ascii) and not data.isascii():
+                return super().dumps(obj, **kwargs)
+            return data.decode()
+
+    app.json = OrjsonProvider(app)
+except ImportError:
+    pass
+
 # SECURE CORS Configuration - Environment-based
 # Development: Allow localhost origins
 # Production: Only allow explicitly configured origins
@@ -168,16 +168,22 @@ def get_all_latest_benchmarks():
     """
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        # Query to get the most recent entry for each (model_name, source) pair
+        # Query to get the most recent entry for each (model_name, source) pair.
+        # The latest timestamps are found in one grouped pass and joined back,
+        # rather than running a correlated MAX() subquery for every row.
         cursor.execute("""
-            SELECT model_name, source, rank, average_score, benchmark_metrics, scraped_at
-            FROM benchmark_results br1
-            WHERE scraped_at = (
-                SELECT MAX(scraped_at)
-                FROM benchmark_results br2
-                WHERE br1.model_name = br2.model_name 
-                AND br1.source = br2.source
-            )
+            SELECT br.model_name, br.source, br.rank, br.average_score,
+                   br.benchmark_metrics, br.scraped_at
+            FROM benchmark_results br
+            JOIN (
+                SELECT model_name, source, MAX(scraped_at) AS latest
+                FROM benchmark_results
+                GROUP BY model_name, source
+            ) lt
+              ON br.model_name = lt.model_name
+             AND br.source = lt.source
+             AND br.scraped_at = lt.latest
+            ORDER BY br.id
         """)
         
         rows = cursor.fetchall()
@@ -11,11 +11,17 @@ This module implements the Phase 2 system prompt specification:
 CORE PRINCIPLE: Help users make confident model decisions by understanding tradeoffs, not by chasing rankings.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Union
-from datetime import datetime
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple, TypedDict, Union
+from datetime import datetime, timedelta
+from functools import lru_cache
 from enum import Enum
+from itertools import islice
+import heapq
 import json
+import sys
+import threading
+from operator import itemgetter
 
 # Add import for database interaction
 try:
@@ -46,6 +52,84 @@ class ContextLength(Enum):
     LONG = "long"
 
 
+# Canonical (interned) priority level strings, so parsed requirements compare by identity
+_PRIORITY_LEVELS = {
+    level.value: sys.intern(level.value) for enum in (Priority, ContextLength) for level in enum
+}
+
+# Priority levels as small ints for scoring; "short"/"long" context share the low/high slots
+LEVEL_LOW, LEVEL_MEDIUM, LEVEL_HIGH = 0, 1, 2
+_LEVEL_INDEX = {"low": LEVEL_LOW, "medium": LEVEL_MEDIUM, "high": LEVEL_HIGH}
+_CONTEXT_INDEX = {"short": LEVEL_LOW, "medium": LEVEL_MEDIUM, "long": LEVEL_HIGH}
+
+
+def _level(priorities: Dict[str, Any], axis: str, index: Dict[str, int]) -> int:
+    value = priorities.get(axis)
+    if isinstance(value, str):
+        return index.get(value.lower(), LEVEL_MEDIUM)
+    return LEVEL_MEDIUM
+
+
+class PriorityLevels(NamedTuple):
+    """A priorities dict packed into LEVEL_* ints, parsed once per request. Unknown values count as medium."""
+    cost: int = LEVEL_MEDIUM
+    quality: int = LEVEL_MEDIUM
+    latency: int = LEVEL_MEDIUM
+    context_length: int = LEVEL_MEDIUM
+    
+    @classmethod
+    def from_priorities(cls, priorities: Any) -> 'PriorityLevels':
+        if not isinstance(priorities, dict):
+            return cls()
+        return cls(
+            cost=_level(priorities, "cost", _LEVEL_INDEX),
+            quality=_level(priorities, "quality", _LEVEL_INDEX),
+            latency=_level(priorities, "latency", _LEVEL_INDEX),
+            context_length=_level(priorities, "context_length", _CONTEXT_INDEX)
+        )
+    
+    @property
+    def packed(self) -> int:
+        """All four levels in one int, two bits per axis."""
+        return self.cost | self.quality << 2 | self.latency << 4 | self.context_length << 6
+
+
+# Use-case keywords that switch on the matching bonuses in scoring
+_CODING_KEYWORDS = ("code", "programming", "developer")
+_DOCUMENT_KEYWORDS = ("document", "analysis", "long")
+_CHAT_KEYWORDS = ("chat", "conversation")
+
+
+class UseCaseTraits(NamedTuple):
+    """Keyword classification of a use case, parsed once per request rather than per model."""
+    coding: bool = False
+    documents: bool = False
+    chat: bool = False
+    
+    @classmethod
+    def from_use_case(cls, use_case: Any) -> 'UseCaseTraits':
+        if not isinstance(use_case, str):
+            return cls()
+        text = use_case.lower()
+        return cls(
+            coding=any(word in text for word in _CODING_KEYWORDS),
+            documents=any(word in text for word in _DOCUMENT_KEYWORDS),
+            chat=any(word in text for word in _CHAT_KEYWORDS)
+        )
+
+
+# Recommendations memoized per analyst instance, keyed on UserRequirements
+RECOMMEND_CACHE_SIZE = 256
+# Cost estimates memoized per analyst instance, keyed on (model_id, monthly_tokens, input_ratio)
+COST_CACHE_SIZE = 512
+
+# Monthly volumes priced in get_cost_breakdown()'s usage tiers (at the default 3:1 ratio)
+_USAGE_TIERS = (("1M_tokens", 1_000_000), ("10M_tokens", 10_000_000), ("100M_tokens", 100_000_000))
+
+# Benchmark fields reported side by side in compare()
+_COMPARE_METRICS = ("arena_elo", "mmlu", "humaneval", "context_window", "latency_ms")
+
+
 # Model pricing data (from real-world sources)
 # Updated: January 2026
 MODEL_PRICING = {
@@ -143,24 +227,120 @@ MODEL_BENCHMARKS = {
 # DATA STRUCTURES
 # ============================================================================
 
-@dataclass
+class AlternativeReason(NamedTuple):
+    """Why an alternative model was not the recommendation."""
+    model: str
+    reasons: List[str]
+
+
+class RequirementMismatch(NamedTuple):
+    """A stated requirement that a model falls short of."""
+    requirement: str
+    model_value: str
+    assessment: str
+
+
+# Wire shapes returned by the to_dict methods below
+
+class UserRequirementsDict(TypedDict):
+    use_case: str
+    priorities: Dict[str, str]
+    monthly_budget_usd: Optional[float]
+    expected_tokens_per_month: Optional[int]
+
+
+class CostAssumptionsDict(TypedDict):
+    input_tokens_per_month: int
+    output_tokens_per_month: int
+    input_price_per_1m_tokens: float
+    output_price_per_1m_tokens: float
+
+
+class CostEstimateDict(TypedDict):
+    monthly_estimate_usd: float
+    assumptions: CostAssumptionsDict
+    within_budget: Optional[bool]
+    budget_headroom_pct: Optional[float]
+
+
+class PrimaryRecommendationDict(TypedDict):
+    model: str
+    provider: str
+    confidence: str
+
+
+class AlternativeReasonDict(TypedDict):
+    model: str
+    reasons: List[str]
+
+
+class RequirementMismatchDict(TypedDict):
+    requirement: str
+    model_value: str
+    assessment: str
+
+
+class ModelRecommendationDict(TypedDict):
+    primary_recommendation: PrimaryRecommendationDict
+    reasoning: str
+    why_not_alternatives: List[AlternativeReasonDict]
+    cost_estimate: CostEstimateDict
+    caveats: List[str]
+    data_freshness: str
+    data_warnings: List[str]
+
+
+class DisqualificationResultDict(TypedDict):
+    model: str
+    is_recommended: bool
+    disqualification_reasons: List[str]
+    requirement_mismatches: List[RequirementMismatchDict]
+    alternative_suggestion: Optional[str]
+
+
+@dataclass(slots=True, frozen=True)
 class UserRequirements:
     """Structured user requirements as defined in the spec."""
     use_case: str
     priorities: Dict[str, str]  # cost, quality, latency, context_length → low/medium/high
     monthly_budget_usd: Optional[float] = None
     expected_tokens_per_month: Optional[int] = None
+    levels: PriorityLevels = field(init=False, repr=False, compare=False)
+    traits: UseCaseTraits = field(init=False, repr=False, compare=False)
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "levels", PriorityLevels.from_priorities(self.priorities))
+        object.__setattr__(self, "traits", UseCaseTraits.from_use_case(self.use_case))
+    
+    def __hash__(self) -> int:
+        # priorities is a dict, so hash its packed levels instead; requirements that
+        # compare equal have equal priorities and therefore equal levels
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash((
+                self.use_case,
+                self.levels.packed,
+                self.monthly_budget_usd,
+                self.expected_tokens_per_month
+            )))
+        return self._hash
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'UserRequirements':
+        priorities = data.get('priorities', {})
+        if isinstance(priorities, dict):
+            priorities = {
+                axis: _PRIORITY_LEVELS.get(level, level) if isinstance(level, str) else level
+                for axis, level in priorities.items()
+            }
         return cls(
             use_case=data.get('use_case', ''),
-            priorities=data.get('priorities', {}),
+            priorities=priorities,
             monthly_budget_usd=data.get('monthly_budget_usd'),
             expected_tokens_per_month=data.get('expected_tokens_per_month')
         )
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> UserRequirementsDict:
         return {
             "use_case": self.use_case,
             "priorities": self.priorities,
@@ -169,7 +349,7 @@ class UserRequirements:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CostEstimate:
     """Cost transparency structure - always shown with assumptions."""
     monthly_estimate_usd: float
@@ -179,8 +359,15 @@ class CostEstimate:
     output_price_per_1m: float
     within_budget: Optional[bool] = None
     budget_headroom_pct: Optional[float] = None
+    _dict: Optional[CostEstimateDict] = field(default=None, init=False, repr=False, compare=False)
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> CostEstimateDict:
+        # Memoized estimates are shared between responses, so build the payload once too
+        if self._dict is None:
+            object.__setattr__(self, "_dict", self._build_dict())
+        return self._dict
+    
+    def _build_dict(self) -> CostEstimateDict:
         return {
             "monthly_estimate_usd": round(self.monthly_estimate_usd, 2),
             "assumptions": {
@@ -190,24 +377,31 @@ class CostEstimate:
                 "output_price_per_1m_tokens": self.output_price_per_1m
             },
             "within_budget": self.within_budget,
-            "budget_headroom_pct": round(self.budget_headroom_pct, 1) if self.budget_headroom_pct else None
+            "budget_headroom_pct": round(self.budget_headroom_pct, 1) if self.budget_headroom_pct is not None else None
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelRecommendation:
     """Full recommendation output as per spec."""
     recommended_model: str
     provider: str
     reasoning: str
-    why_not_alternatives: List[Dict[str, str]]
+    why_not_alternatives: List[AlternativeReason]
     cost_estimate: CostEstimate
     caveats: List[str]
     data_freshness: str
     data_warnings: List[str]
     confidence: str  # high, medium, low
+    _dict: Optional[ModelRecommendationDict] = field(default=None, init=False, repr=False, compare=False)
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> ModelRecommendationDict:
+        # Frozen, so the payload is built once and shared; callers must not mutate it
+        if self._dict is None:
+            object.__setattr__(self, "_dict", self._build_dict())
+        return self._dict
+    
+    def _build_dict(self) -> ModelRecommendationDict:
         return {
             "primary_recommendation": {
                 "model": self.recommended_model,
@@ -215,7 +409,9 @@ class ModelRecommendation:
                 "confidence": self.confidence
             },
             "reasoning": self.reasoning,
-            "why_not_alternatives": self.why_not_alternatives,
+            "why_not_alternatives": [
+                {"model": alt.model, "reasons": alt.reasons} for alt in self.why_not_alternatives
+            ],
             "cost_estimate": self.cost_estimate.to_dict(),
             "caveats": self.caveats,
             "data_freshness": self.data_freshness,
@@ -223,26 +419,29 @@ class ModelRecommendation:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DisqualificationResult:
     """Disqualifier mode output."""
     model: str
     is_recommended: bool
     disqualification_reasons: List[str]
-    requirement_mismatches: List[Dict[str, str]]
+    requirement_mismatches: List[RequirementMismatch]
     alternative_suggestion: Optional[str] = None
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> DisqualificationResultDict:
         return {
             "model": self.model,
             "is_recommended": self.is_recommended,
             "disqualification_reasons": self.disqualification_reasons,
-            "requirement_mismatches": self.requirement_mismatches,
+            "requirement_mismatches": [
+                {"requirement": m.requirement, "model_value": m.model_value, "assessment": m.assessment}
+                for m in self.requirement_mismatches
+            ],
             "alternative_suggestion": self.alternative_suggestion
         }
 
 
-@dataclass 
+@dataclass(slots=True, frozen=True)
 class ModelComparison:
     """Side-by-side comparison output."""
     model_a: str
@@ -256,8 +455,15 @@ class ModelComparison:
     benchmark_deltas: Dict[str, Dict[str, Any]]
     cost_comparison: Dict[str, Any]
     data_freshness: str
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
+        # Frozen, so the payload is built once and shared; callers must not mutate it
+        if self._dict is None:
+            object.__setattr__(self, "_dict", self._build_dict())
+        return self._dict
+    
+    def _build_dict(self) -> Dict[str, Any]:
         return {
             "models_compared": {
                 "model_a": self.model_a,
@@ -279,6 +485,80 @@ class ModelComparison:
         }
 
 
+def _safe_float(val, default=0):
+    """Safely convert value to float, handling strings or None."""
+    # Exact type checks first: almost every value is already a float or int
+    if type(val) is float:
+        return val
+    if type(val) is int:
+        return float(val)
+    if val is None:
+        return default
+    try:
+        return float(val)
+    except (ValueError, TypeError):
+        return default
+
+
+class _AliasIndex:
+    """
+    Resolves DB model names to benchmark keys that match on a '/'-separated suffix
+    either way round (e.g. 'openai/gpt-4o' <-> 'gpt-4o'). When several keys match,
+    the earliest-inserted key wins, as with a linear scan over the keys.
+    """
+    
+    def __init__(self, keys):
+        self._order: Dict[str, int] = {}
+        self._by_suffix: Dict[str, str] = {}
+        for key in keys:
+            self.add(key)
+    
+    def add(self, key: str):
+        if key in self._order:
+            return
+        self._order[key] = len(self._order)
+        i = key.find('/')
+        while i != -1:
+            self._by_suffix.setdefault(key[i + 1:], key)
+            i = key.find('/', i + 1)
+    
+    def resolve(self, name: str) -> Optional[str]:
+        # Keys ending in '/' + name
+        candidates = [self._by_suffix[name]] if name in self._by_suffix else []
+        # Keys that name ends with, after a '/'
+        i = name.find('/')
+        while i != -1:
+            tail = name[i + 1:]
+            if tail in self._order:
+                candidates.append(tail)
+            i = name.find('/', i + 1)
+        return min(candidates, key=self._order.__getitem__) if candidates else None
+
+
+class _ModelMetrics(NamedTuple):
+    """Scoring inputs and summary text for one model, derived once per data snapshot."""
+    total_price: float
+    arena_elo: float
+    latency_ms: float
+    context_window: float
+    humaneval: float
+    strengths_sentence: Optional[str]  # "Strengths: a, b." or None
+    caveats: Tuple[str, ...]  # "Note: ..." for the first two weaknesses
+
+
+def _token_cost(
+    input_price: float,
+    output_price: float,
+    monthly_tokens: int,
+    input_ratio: float
+) -> Tuple[int, int, float]:
+    """Split monthly tokens by input ratio and price them: (input_tokens, output_tokens, usd)."""
+    input_tokens = int(monthly_tokens * input_ratio)
+    output_tokens = int(monthly_tokens * (1 - input_ratio))
+    total_cost = (input_tokens / 1_000_000) * input_price + (output_tokens / 1_000_000) * output_price
+    return input_tokens, output_tokens, total_cost
+
+
 # ============================================================================
 # MODELSCOUT ANALYST ENGINE
 # ============================================================================
@@ -292,6 +572,20 @@ class ModelScoutAnalyst:
     Explains tradeoffs, limitations, and cost implications honestly.
     """
     
+    __slots__ = (
+        "benchmark_data",
+        "pricing_data",
+        "data_timestamp",
+        "_last_db_results",
+        "_recommend_cached",
+        "_cost_cached",
+        "_freshness_cache",
+        "_metrics",
+        "_data_warnings",
+        "_benchmark_keys",
+        "_pricing_keys",
+    )
+    
     def __init__(
         self, 
         benchmark_data: Dict[str, Dict] = None,
@@ -302,21 +596,22 @@ class ModelScoutAnalyst:
         self.pricing_data = pricing_data or MODEL_PRICING
         self.data_timestamp = data_timestamp or datetime.utcnow().isoformat()
         
+        # Last DB snapshot applied by refresh_data(); unchanged snapshots keep the cache
+        self._last_db_results = None
+        # Per instance, so an analyst replaced by refresh_analyst() takes its cache with it
+        self._recommend_cached = lru_cache(maxsize=RECOMMEND_CACHE_SIZE)(self._recommend)
+        self._cost_cached = lru_cache(maxsize=COST_CACHE_SIZE)(self._calculate_cost)
+        # (data_timestamp, valid_until, statement) for _get_data_freshness()
+        self._freshness_cache = (None, None, None)
+        
         # Initial data load from DB if available
         if DATABASE_AVAILABLE:
             try:
                 self.refresh_data()
             except Exception as e:
                 print(f"[WARN] Failed to refresh analyst data from DB: {e}")
+        self._rebuild_metrics()
     
-    def _safe_float(self, val, default=0):
-        """Safely convert value to float, handling strings or None."""
-        try:
-            if val is None: return default
-            return float(val)
-        except (ValueError, TypeError):
-            return default
-
     def refresh_data(self):
         """
         Refresh benchmark and pricing data from the database.
@@ -328,11 +623,17 @@ class ModelScoutAnalyst:
         db_results = get_all_latest_benchmarks()
         if not db_results:
             return
+        
+        if db_results == self._last_db_results:
+            # Same snapshot as last time: the merge below would be a no-op
+            self.data_timestamp = datetime.utcnow().isoformat()
+            return
 
         # Map DB model names to our internal benchmark structure
         # We preserve our existing hardcoded metadata (strengths, weaknesses)
         # but override the actual scores.
         
+        aliases = _AliasIndex(self.benchmark_data)
         for db_model_id, sources in db_results.items():
             # Match DB model IDs to our internal keys
             # Handle canonical prefixes (e.g., 'openai/gpt-4o' matching 'gpt-4o')
@@ -341,10 +642,7 @@ class ModelScoutAnalyst:
                 model_id = db_model_id
             else:
                 # Try finding a match ignoring prefixes or vice versa
-                for k in self.benchmark_data.keys():
-                    if db_model_id.endswith('/' + k) or k.endswith('/' + db_model_id):
-                        model_id = k
-                        break
+                model_id = aliases.resolve(db_model_id)
             
             # If still not found, check if it's a known model we should track
             if not model_id:
@@ -352,12 +650,13 @@ class ModelScoutAnalyst:
                     model_id = db_model_id
                 else:
                     # Initialize new model entry if it has data
-                    model_id = db_model_id
+                    model_id = sys.intern(db_model_id)
                     if model_id not in self.benchmark_data:
                         self.benchmark_data[model_id] = {
                             "strengths": ["Data recently retrieved from live benchmarks"],
                             "weaknesses": []
                         }
+                        aliases.add(model_id)
             
             profile = self.benchmark_data[model_id]
             
@@ -367,27 +666,27 @@ class ModelScoutAnalyst:
             if "lmsys_arena" in sources:
                 arena = sources["lmsys_arena"]
                 if "arena_elo" in arena:
-                    profile["arena_elo"] = self._safe_float(arena["arena_elo"])
+                    profile["arena_elo"] = _safe_float(arena["arena_elo"])
                 elif "average_score" in arena:
-                    profile["arena_elo"] = self._safe_float(arena["average_score"])
+                    profile["arena_elo"] = _safe_float(arena["average_score"])
             
             # 2. HuggingFace -> mmlu
             if "huggingface" in sources:
                 hf = sources["huggingface"]
                 metrics = hf.get("metrics", hf)
                 if "mmlu" in metrics:
-                    profile["mmlu"] = self._safe_float(metrics["mmlu"])
+                    profile["mmlu"] = _safe_float(metrics["mmlu"])
                 elif "average_score" in hf:
-                    profile["mmlu"] = self._safe_float(hf["average_score"])
+                    profile["mmlu"] = _safe_float(hf["average_score"])
             
             # 3. LiveCodeBench -> humaneval
             if "livecodebench" in sources:
                 lcb = sources["livecodebench"]
                 metrics = lcb.get("metrics", lcb)
                 if "humaneval" in metrics:
-                    profile["humaneval"] = self._safe_float(metrics["humaneval"])
+                    profile["humaneval"] = _safe_float(metrics["humaneval"])
                 elif "pass_at_1" in metrics:
-                    profile["humaneval"] = self._safe_float(metrics["pass_at_1"])
+                    profile["humaneval"] = _safe_float(metrics["pass_at_1"])
             
             # 4. Vellum -> economics (context, latency, pricing)
             if "vellum" in sources:
@@ -395,36 +694,92 @@ class ModelScoutAnalyst:
                 metrics = vel.get("metrics", vel)
                 
                 if "context_window" in metrics:
-                    profile["context_window"] = int(self._safe_float(metrics["context_window"]))
+                    profile["context_window"] = int(_safe_float(metrics["context_window"]))
                 if "latency_ms" in metrics:
-                    profile["latency_ms"] = self._safe_float(metrics["latency_ms"])
+                    profile["latency_ms"] = _safe_float(metrics["latency_ms"])
                 
                 # Dynamic pricing override
                 if "input_price" in metrics and "output_price" in metrics:
                     if model_id in self.pricing_data:
-                        self.pricing_data[model_id]["input"] = self._safe_float(metrics["input_price"])
-                        self.pricing_data[model_id]["output"] = self._safe_float(metrics["output_price"])
+                        self.pricing_data[model_id]["input"] = _safe_float(metrics["input_price"])
+                        self.pricing_data[model_id]["output"] = _safe_float(metrics["output_price"])
 
+        self._last_db_results = db_results
+        self._rebuild_metrics()
+        self._recommend_cached.cache_clear()
+        self._cost_cached.cache_clear()
         self.data_timestamp = datetime.utcnow().isoformat()
         print(f"[OK] AI Analyst refreshed with real data for {len(db_results)} models")
 
+    def _model_metrics(self, model_id: str) -> _ModelMetrics:
+        """Coerce the benchmark and pricing fields used in scoring for one model."""
+        benchmarks = self.benchmark_data.get(model_id, {})
+        pricing = self.pricing_data.get(model_id, {})
+        strengths = benchmarks.get("strengths")
+        weaknesses = benchmarks.get("weaknesses")
+        return _ModelMetrics(
+            total_price=_safe_float(pricing.get("input", 0)) + _safe_float(pricing.get("output", 0)),
+            arena_elo=_safe_float(benchmarks.get("arena_elo", 0)),
+            latency_ms=_safe_float(benchmarks.get("latency_ms", 1000)),
+            context_window=_safe_float(benchmarks.get("context_window", 4096)),
+            humaneval=_safe_float(benchmarks.get("humaneval", 0)),
+            strengths_sentence=f"Strengths: {', '.join(strengths[:2])}." if strengths else None,
+            caveats=tuple(f"Note: {weakness}" for weakness in weaknesses[:2]) if weaknesses else ()
+        )
+    
+    def _metrics_for(self, model_id: str) -> _ModelMetrics:
+        """Precomputed metrics for a model, computing them if the model was added since the last rebuild."""
+        return self._metrics.get(model_id) or self._model_metrics(model_id)
+    
+    def _rebuild_metrics(self):
+        """Precompute scoring metrics, data warnings and model key lists; call whenever the data changes."""
+        self._metrics = {model_id: self._model_metrics(model_id) for model_id in self.benchmark_data}
+        self._data_warnings = self._collect_data_warnings()
+        self._benchmark_keys = tuple(self.benchmark_data)
+        self._pricing_keys = tuple(self.pricing_data)
+    
+    def _collect_data_warnings(self) -> Tuple[str, ...]:
+        """Incomplete-data warnings reported by get_data_status()."""
+        warnings = []
+        for model, bench in self.benchmark_data.items():
+            if not bench.get("arena_elo"):
+                warnings.append(f"{model}: Arena ELO unavailable")
+            if not bench.get("humaneval"):
+                warnings.append(f"{model}: HumanEval benchmark unavailable")
+        
+        pricing = self.pricing_data
+        for model in self.benchmark_data:
+            if model not in pricing:
+                warnings.append(f"{model}: Pricing data unavailable")
+        return tuple(warnings)
+    
     def _get_data_freshness(self) -> str:
         """Return data freshness statement."""
+        now = datetime.utcnow()
+        cached_ts, valid_until, statement = self._freshness_cache
+        if cached_ts == self.data_timestamp and now < valid_until:
+            return statement
+        
         try:
-            ts = datetime.fromisoformat(self.data_timestamp.replace('Z', '+00:00'))
-            now = datetime.utcnow()
-            delta = now - ts.replace(tzinfo=None)
+            ts = datetime.fromisoformat(self.data_timestamp.replace('Z', '+00:00')).replace(tzinfo=None)
+            delta = now - ts
+            # The statement only changes when the day count rolls over
+            valid_until = ts + timedelta(days=delta.days + 1)
             
             if delta.days == 0:
-                return "Benchmarks last updated today."
+                statement = "Benchmarks last updated today."
             elif delta.days == 1:
-                return "Benchmarks last updated yesterday."
+                statement = "Benchmarks last updated yesterday."
             elif delta.days < 7:
-                return f"Benchmarks last updated {delta.days} days ago."
+                statement = f"Benchmarks last updated {delta.days} days ago."
             else:
-                return f"Benchmarks last updated {delta.days} days ago. Consider refreshing data."
+                statement = f"Benchmarks last updated {delta.days} days ago. Consider refreshing data."
         except:
-            return f"Benchmark snapshot date: {self.data_timestamp}"
+            valid_until = datetime.max
+            statement = f"Benchmark snapshot date: {self.data_timestamp}"
+        
+        self._freshness_cache = (self.data_timestamp, valid_until, statement)
+        return statement
     
     def _calculate_cost(
         self, 
@@ -437,13 +792,9 @@ class ModelScoutAnalyst:
         
         input_price = pricing.get("input", 0)
         output_price = pricing.get("output", 0)
-        
-        input_tokens = int(monthly_tokens * input_ratio)
-        output_tokens = int(monthly_tokens * (1 - input_ratio))
-        
-        input_cost = (input_tokens / 1_000_000) * input_price
-        output_cost = (output_tokens / 1_000_000) * output_price
-        total_cost = input_cost + output_cost
+        input_tokens, output_tokens, total_cost = _token_cost(
+            input_price, output_price, monthly_tokens, input_ratio
+        )
         
         return CostEstimate(
             monthly_estimate_usd=total_cost,
@@ -453,6 +804,11 @@ class ModelScoutAnalyst:
             output_price_per_1m=output_price
         )
     
+    def _monthly_cost(self, model_id: str, monthly_tokens: int, input_ratio: float = 0.75) -> float:
+        """Monthly USD cost only, for budget checks that don't need a full CostEstimate."""
+        pricing = self.pricing_data.get(model_id, {})
+        return _token_cost(pricing.get("input", 0), pricing.get("output", 0), monthly_tokens, input_ratio)[2]
+    
     def _score_model_fit(
         self, 
         model_id: str, 
@@ -462,22 +818,38 @@ class ModelScoutAnalyst:
         Score how well a model fits user requirements.
         Returns (score, fit_reasons, disqualify_reasons)
         """
-        benchmarks = self.benchmark_data.get(model_id, {})
-        pricing = self.pricing_data.get(model_id, {})
+        disqualify_reasons = self._disqualify_reasons(model_id, requirements)
+        if not self.benchmark_data.get(model_id):
+            return 0, [], disqualify_reasons
+        score, fit_reasons = self._score_fit(model_id, requirements)
+        return score, fit_reasons, disqualify_reasons
+    
+    def _disqualify_reasons(self, model_id: str, requirements: UserRequirements) -> List[str]:
+        """Hard constraints, cheap enough to check before scoring: benchmark coverage and budget."""
+        if not self.benchmark_data.get(model_id):
+            return ["Model benchmarks not available"]
         
-        if not benchmarks:
-            return 0, [], ["Model benchmarks not available"]
+        # === BUDGET CHECK (Hard disqualification) ===
+        budget = requirements.monthly_budget_usd
+        tokens = requirements.expected_tokens_per_month
+        if budget and tokens:
+            monthly_cost = self._monthly_cost(model_id, tokens)
+            if monthly_cost > budget * 1.1:
+                return [f"Exceeds budget: ~${monthly_cost:.0f}/mo vs ${budget} budget"]
+        return []
+    
+    def _score_fit(self, model_id: str, requirements: UserRequirements) -> Tuple[int, List[str]]:
+        """Soft scoring for a model with benchmark data. Returns (score, fit_reasons)."""
+        metrics = self._metrics_for(model_id)
         
         score = 50  # Base score
         fit_reasons = []
-        disqualify_reasons = []
-        priorities = requirements.priorities
+        levels = requirements.levels
         
         # === COST PRIORITY ===
-        cost_priority = priorities.get("cost", "medium").lower()
-        total_price = self._safe_float(pricing.get("input", 0)) + self._safe_float(pricing.get("output", 0))
+        total_price = metrics.total_price
         
-        if cost_priority == "low":
+        if levels.cost == LEVEL_LOW:
             if total_price < 2.0:
                 score += 25
                 fit_reasons.append("Low cost tier matches your budget priority")
@@ -487,15 +859,14 @@ class ModelScoutAnalyst:
             else:
                 score -= 15
                 fit_reasons.append("Higher cost may strain budget")
-        elif cost_priority == "high":
+        elif levels.cost == LEVEL_HIGH:
             # User is willing to pay for quality
             score += 5
             
         # === QUALITY PRIORITY ===
-        quality_priority = priorities.get("quality", "medium").lower()
-        arena_elo = self._safe_float(benchmarks.get("arena_elo", 0))
+        arena_elo = metrics.arena_elo
         
-        if quality_priority == "high":
+        if levels.quality == LEVEL_HIGH:
             if arena_elo >= 1270:
                 score += 30
                 fit_reasons.append("Top-tier reasoning quality (Arena ELO > 1270)")
@@ -505,14 +876,13 @@ class ModelScoutAnalyst:
             elif arena_elo < 1180:
                 score -= 20
                 fit_reasons.append("May not meet high quality requirements")
-        elif quality_priority == "low":
+        elif levels.quality == LEVEL_LOW:
             score += 5  # Don't penalize lower quality models
             
         # === LATENCY PRIORITY ===
-        latency_priority = priorities.get("latency", "medium").lower()
-        latency = self._safe_float(benchmarks.get("latency_ms", 1000))
+        latency = metrics.latency_ms
         
-        if latency_priority == "low":  # User wants low latency
+        if levels.latency == LEVEL_LOW:  # User wants low latency
             if latency < 400:
                 score += 20
                 fit_reasons.append("Very low latency for real-time applications")
@@ -524,10 +894,9 @@ class ModelScoutAnalyst:
                 fit_reasons.append("Higher latency may impact user experience")
                 
         # === CONTEXT LENGTH PRIORITY ===
-        context_priority = priorities.get("context_length", "medium").lower()
-        context_window = self._safe_float(benchmarks.get("context_window", 4096))
+        context_window = metrics.context_window
         
-        if context_priority == "long":
+        if levels.context_length == LEVEL_HIGH:
             if context_window >= 200000:
                 score += 25
                 fit_reasons.append("Handles very long documents (200K+ tokens)")
@@ -539,35 +908,27 @@ class ModelScoutAnalyst:
                 fit_reasons.append("Limited context may require document chunking")
                 
         # === USE CASE MATCHING ===
-        use_case = requirements.use_case.lower()
+        traits = requirements.traits
         
-        if "code" in use_case or "programming" in use_case or "developer" in use_case:
-            humaneval = self._safe_float(benchmarks.get("humaneval", 0))
+        if traits.coding:
+            humaneval = metrics.humaneval
             if humaneval >= 90:
                 score += 15
                 fit_reasons.append("Excellent coding benchmark scores")
             elif humaneval < 80:
                 fit_reasons.append("Coding performance is moderate")
                 
-        if "document" in use_case or "analysis" in use_case or "long" in use_case:
+        if traits.documents:
             if context_window >= 100000:
                 score += 10
                 fit_reasons.append("Well-suited for document analysis")
                 
-        if "chat" in use_case or "conversation" in use_case:
+        if traits.chat:
             if latency < 500:
                 score += 10
                 fit_reasons.append("Fast response times for conversational use")
                 
-        # === BUDGET CHECK (Hard disqualification) ===
-        if requirements.monthly_budget_usd and requirements.expected_tokens_per_month:
-            cost_est = self._calculate_cost(model_id, requirements.expected_tokens_per_month)
-            if cost_est.monthly_estimate_usd > requirements.monthly_budget_usd * 1.1:
-                disqualify_reasons.append(
-                    f"Exceeds budget: ~${cost_est.monthly_estimate_usd:.0f}/mo vs ${requirements.monthly_budget_usd} budget"
-                )
-                
-        return score, fit_reasons, disqualify_reasons
+        return score, fit_reasons
     
     # =========================================================================
     # A. MODEL RECOMMENDATION EXPLANATION
@@ -583,42 +944,78 @@ class ModelScoutAnalyst:
         - Why other models were not chosen
         - Cost estimate
         - Important caveats
+        
+        Results are cached until refresh_data() loads a different DB snapshot.
         """
-        all_scores = {}
+        try:
+            hash(requirements)
+        except TypeError:
+            # Unhashable budget/token values from a malformed request; skip the cache
+            return self._recommend(requirements)
+        
+        rec = self._recommend_cached(requirements)
+        freshness = self._get_data_freshness()
+        if rec.data_freshness != freshness:
+            rec = replace(rec, data_freshness=freshness)
+        return rec
+    
+    def _score_candidates(self, requirements: UserRequirements) -> tuple:
+        """
+        Score every model against the requirements.
+        Returns (candidates, disqualified): (model_id, score, fit_reasons) tuples for
+        qualifying models and disqualify reasons by model, both in model order.
+        """
+        candidates = []
         disqualified = {}
         
-        # Score all models
-        for model_id in self.benchmark_data.keys():
-            score, fit_reasons, disqualify_reasons = self._score_model_fit(model_id, requirements)
-            
+        disqualify = self._disqualify_reasons
+        score_fit = self._score_fit
+        append = candidates.append
+        
+        # Disqualified models are skipped before scoring
+        for model_id in self.benchmark_data:
+            disqualify_reasons = disqualify(model_id, requirements)
             if disqualify_reasons:
                 disqualified[model_id] = disqualify_reasons
-            else:
-                all_scores[model_id] = {
-                    "score": score,
-                    "reasons": fit_reasons
-                }
+                continue
+            
+            score, fit_reasons = score_fit(model_id, requirements)
+            append((model_id, score, fit_reasons))
+        
+        return candidates, disqualified
+    
+    def _best_model_id(self, requirements: UserRequirements) -> Optional[str]:
+        """The model recommend() would pick, without building the recommendation."""
+        candidates, _ = self._score_candidates(requirements)
+        if not candidates:
+            return None
+        return max(candidates, key=itemgetter(1))[0]
+    
+    def _recommend(self, requirements: UserRequirements) -> ModelRecommendation:
+        """Score every model against the requirements and build the recommendation."""
+        candidates, disqualified = self._score_candidates(requirements)
         
-        if not all_scores:
+        if not candidates:
             # No models qualify
             return self._no_match_recommendation(requirements, disqualified)
         
-        # Rank by score
-        ranked = sorted(all_scores.items(), key=lambda x: x[1]["score"], reverse=True)
+        # Rank by score; only the winner and three runners-up are used
+        ranked = heapq.nlargest(4, candidates, key=itemgetter(1))
         
-        top_model = ranked[0][0]
-        top_data = ranked[0][1]
+        top_model, top_score, top_reasons = ranked[0]
         top_benchmarks = self.benchmark_data.get(top_model, {})
         pricing = self.pricing_data.get(top_model, {})
         
         # Build "why not" explanations for top alternatives
         why_not_alternatives = []
-        for model_id, data in ranked[1:4]:
+        top_metrics = self._metrics_for(top_model)
+        top_total = top_metrics.total_price
+        for model_id, score, _ in ranked[1:]:
             benchmarks = self.benchmark_data.get(model_id, {})
             reasons = []
             
             # Compare to winner
-            if data["score"] < top_data["score"] - 20:
+            if score < top_score - 20:
                 reasons.append("Significantly lower overall fit score")
             
             # Specific comparisons
@@ -628,53 +1025,44 @@ class ModelScoutAnalyst:
                 reasons.append(f"Lower reasoning scores (ELO: {alt_elo} vs {top_elo})")
                 
             # Cost comparison
-            alt_pricing = self.pricing_data.get(model_id, {})
-            alt_total = alt_pricing.get("input", 0) + alt_pricing.get("output", 0)
-            top_total = pricing.get("input", 0) + pricing.get("output", 0)
-            if alt_total > top_total * 1.5:
+            if self._metrics_for(model_id).total_price > top_total * 1.5:
                 reasons.append("Higher cost without proportional quality gain")
                 
             if not reasons:
                 reasons.append("Slightly lower overall match with your requirements")
                 
-            why_not_alternatives.append({
-                "model": model_id,
-                "reasons": reasons
-            })
+            why_not_alternatives.append(AlternativeReason(model_id, reasons))
         
         # Add disqualified models
-        for model_id, reasons in list(disqualified.items())[:2]:
-            why_not_alternatives.append({
-                "model": model_id,
-                "reasons": reasons
-            })
+        for model_id, reasons in islice(disqualified.items(), 2):
+            why_not_alternatives.append(AlternativeReason(model_id, reasons))
         
         # Calculate cost
         tokens = requirements.expected_tokens_per_month or 1_000_000
         cost_estimate = self._calculate_cost(top_model, tokens)
         
         if requirements.monthly_budget_usd:
-            cost_estimate.within_budget = cost_estimate.monthly_estimate_usd <= requirements.monthly_budget_usd
-            if requirements.monthly_budget_usd > 0:
-                cost_estimate.budget_headroom_pct = (
-                    (requirements.monthly_budget_usd - cost_estimate.monthly_estimate_usd) 
-                    / requirements.monthly_budget_usd * 100
+            budget = requirements.monthly_budget_usd
+            cost_estimate = replace(
+                cost_estimate,
+                within_budget=cost_estimate.monthly_estimate_usd <= budget,
+                budget_headroom_pct=(
+                    (budget - cost_estimate.monthly_estimate_usd) / budget * 100
+                    if budget > 0 else None
                 )
+            )
         
         # Build reasoning
         reasoning_parts = [
             f"This model is recommended for: {requirements.use_case}.",
         ]
-        if top_data["reasons"]:
-            reasoning_parts.append("Key factors: " + "; ".join(top_data["reasons"][:3]) + ".")
-        if top_benchmarks.get("strengths"):
-            reasoning_parts.append(f"Strengths: {', '.join(top_benchmarks['strengths'][:2])}.")
+        if top_reasons:
+            reasoning_parts.append(f"Key factors: {'; '.join(top_reasons[:3])}.")
+        if top_metrics.strengths_sentence:
+            reasoning_parts.append(top_metrics.strengths_sentence)
         
         # Build caveats
-        caveats = []
-        if top_benchmarks.get("weaknesses"):
-            for weakness in top_benchmarks["weaknesses"][:2]:
-                caveats.append(f"Note: {weakness}")
+        caveats = list(top_metrics.caveats)
                 
         if requirements.priorities.get("latency") == "low":
             latency = top_benchmarks.get("latency_ms", 0)
@@ -697,7 +1085,7 @@ class ModelScoutAnalyst:
             caveats=caveats,
             data_freshness=self._get_data_freshness(),
             data_warnings=data_warnings,
-            confidence="high" if top_data["score"] > 80 else "medium" if top_data["score"] > 60 else "low"
+            confidence="high" if top_score > 80 else "medium" if top_score > 60 else "low"
         )
     
     def _no_match_recommendation(
@@ -711,7 +1099,7 @@ class ModelScoutAnalyst:
             provider="N/A",
             reasoning="No models in the database meet all your specified requirements. Consider relaxing budget or quality constraints.",
             why_not_alternatives=[
-                {"model": m, "reasons": r} for m, r in list(disqualified.items())[:3]
+                AlternativeReason(m, r) for m, r in islice(disqualified.items(), 3)
             ],
             cost_estimate=CostEstimate(0, 0, 0, 0, 0),
             caveats=["All available models were disqualified based on your constraints"],
@@ -743,67 +1131,66 @@ class ModelScoutAnalyst:
                 is_recommended=False,
                 disqualification_reasons=["Model not found in benchmark database"],
                 requirement_mismatches=[],
-                alternative_suggestion=list(self.benchmark_data.keys())[0] if self.benchmark_data else None
+                alternative_suggestion=next(iter(self.benchmark_data), None)
             )
         
         score, fit_reasons, disqualify_reasons = self._score_model_fit(model_id, requirements)
         benchmarks = self.benchmark_data.get(model_id, {})
-        pricing = self.pricing_data.get(model_id, {})
         
         requirement_mismatches = []
-        priorities = requirements.priorities
+        levels = requirements.levels
         
         # Check each priority for mismatches
         # Cost mismatch
-        if priorities.get("cost", "").lower() == "low":
-            total_price = pricing.get("input", 0) + pricing.get("output", 0)
+        if levels.cost == LEVEL_LOW:
+            total_price = self._metrics_for(model_id).total_price
             if total_price > 10:
-                requirement_mismatches.append({
-                    "requirement": "Low cost priority",
-                    "model_value": f"${total_price:.2f} per 1M tokens (input+output)",
-                    "assessment": "Model is in the high-cost tier"
-                })
+                requirement_mismatches.append(RequirementMismatch(
+                    requirement="Low cost priority",
+                    model_value=f"${total_price:.2f} per 1M tokens (input+output)",
+                    assessment="Model is in the high-cost tier"
+                ))
         
         # Quality mismatch
-        if priorities.get("quality", "").lower() == "high":
+        if levels.quality == LEVEL_HIGH:
             arena_elo = benchmarks.get("arena_elo", 0)
             if arena_elo < 1220:
-                requirement_mismatches.append({
-                    "requirement": "High quality priority",
-                    "model_value": f"Arena ELO: {arena_elo}",
-                    "assessment": "Benchmark scores below top-tier threshold (1220+)"
-                })
+                requirement_mismatches.append(RequirementMismatch(
+                    requirement="High quality priority",
+                    model_value=f"Arena ELO: {arena_elo}",
+                    assessment="Benchmark scores below top-tier threshold (1220+)"
+                ))
         
         # Latency mismatch
-        if priorities.get("latency", "").lower() == "low":
+        if levels.latency == LEVEL_LOW:
             latency = benchmarks.get("latency_ms", 0)
             if latency > 700:
-                requirement_mismatches.append({
-                    "requirement": "Low latency priority",
-                    "model_value": f"{latency}ms average latency",
-                    "assessment": "Response time exceeds low-latency threshold (700ms)"
-                })
+                requirement_mismatches.append(RequirementMismatch(
+                    requirement="Low latency priority",
+                    model_value=f"{latency}ms average latency",
+                    assessment="Response time exceeds low-latency threshold (700ms)"
+                ))
         
         # Context mismatch
-        if priorities.get("context_length", "").lower() == "long":
+        if levels.context_length == LEVEL_HIGH:
             context = benchmarks.get("context_window", 0)
             if context < 100000:
-                requirement_mismatches.append({
-                    "requirement": "Long context priority",
-                    "model_value": f"{context:,} token context window",
-                    "assessment": "Context window may require document chunking"
-                })
+                requirement_mismatches.append(RequirementMismatch(
+                    requirement="Long context priority",
+                    model_value=f"{context:,} token context window",
+                    assessment="Context window may require document chunking"
+                ))
         
         # Budget check
         if requirements.monthly_budget_usd and requirements.expected_tokens_per_month:
-            cost_est = self._calculate_cost(model_id, requirements.expected_tokens_per_month)
-            if cost_est.monthly_estimate_usd > requirements.monthly_budget_usd:
-                over_by = cost_est.monthly_estimate_usd - requirements.monthly_budget_usd
-                requirement_mismatches.append({
-                    "requirement": f"Monthly budget: ${requirements.monthly_budget_usd}",
-                    "model_value": f"Estimated: ${cost_est.monthly_estimate_usd:.0f}/month",
-                    "assessment": f"Exceeds budget by ${over_by:.0f}/month"
-                })
+            monthly_cost = self._monthly_cost(model_id, requirements.expected_tokens_per_month)
+            if monthly_cost > requirements.monthly_budget_usd:
+                over_by = monthly_cost - requirements.monthly_budget_usd
+                requirement_mismatches.append(RequirementMismatch(
+                    requirement=f"Monthly budget: ${requirements.monthly_budget_usd}",
+                    model_value=f"Estimated: ${monthly_cost:.0f}/month",
+                    assessment=f"Exceeds budget by ${over_by:.0f}/month"
+                ))
                 disqualify_reasons.append(f"Budget exceeded by ${over_by:.0f}/month")
         
         # Determine if recommended
@@ -812,9 +1199,7 @@ class ModelScoutAnalyst:
         # Find alternative
         alternative = None
         if not is_recommended:
-            rec = self.recommend(requirements)
-            if rec.recommended_model != "None":
-                alternative = rec.recommended_model
+            alternative = self._best_model_id(requirements)
         
         return DisqualificationResult(
             model=model_id,
@@ -873,24 +1258,25 @@ class ModelScoutAnalyst:
         # Calculate benchmark deltas
         benchmark_deltas = {}
         
-        metrics_to_compare = ["arena_elo", "mmlu", "humaneval", "context_window", "latency_ms"]
-        for metric in metrics_to_compare:
-            val_a = bench_a.get(metric)
-            val_b = bench_b.get(metric)
-            if val_a is not None and val_b is not None:
-                delta = val_a - val_b
-                delta_pct = (delta / val_b * 100) if val_b != 0 else 0
-                benchmark_deltas[metric] = {
-                    model_a: val_a,
-                    model_b: val_b,
-                    "delta": delta,
-                    "delta_pct": round(delta_pct, 1),
-                    "leader": model_a if delta > 0 else model_b if delta < 0 else "tie"
-                }
+        for metric, val_a, val_b in zip(
+            _COMPARE_METRICS,
+            map(bench_a.get, _COMPARE_METRICS),
+            map(bench_b.get, _COMPARE_METRICS)
+        ):
+            if val_a is None or val_b is None:
+                continue
+            delta = val_a - val_b
+            benchmark_deltas[metric] = {
+                model_a: val_a,
+                model_b: val_b,
+                "delta": delta,
+                "delta_pct": round(delta / val_b * 100, 1) if val_b != 0 else 0,
+                "leader": model_a if delta > 0 else model_b if delta < 0 else "tie"
+            }
         
         # Cost comparison
-        total_a = price_a.get("input", 0) + price_a.get("output", 0)
-        total_b = price_b.get("input", 0) + price_b.get("output", 0)
+        total_a = self._metrics_for(model_a).total_price
+        total_b = self._metrics_for(model_b).total_price
         cost_comparison = {
             model_a: {
                 "input_per_1m": price_a.get("input", 0),
@@ -1010,10 +1396,13 @@ class ModelScoutAnalyst:
         if not pricing:
             return {
                 "error": f"Pricing data not available for {model_id}",
-                "available_models": list(self.pricing_data.keys())
+                "available_models": self._pricing_keys
             }
         
-        cost_estimate = self._calculate_cost(model_id, monthly_tokens, input_ratio)
+        # CostEstimate is frozen, so cached instances can be shared between requests
+        cost_estimate = self._cost_cached(model_id, monthly_tokens, input_ratio)
+        input_price = pricing.get("input", 0)
+        output_price = pricing.get("output", 0)
         
         return {
             "model": model_id,
@@ -1024,9 +1413,8 @@ class ModelScoutAnalyst:
                 "output_per_1m_tokens": pricing["output"]
             },
             "usage_tiers": {
-                "1M_tokens": self._calculate_cost(model_id, 1_000_000).monthly_estimate_usd,
-                "10M_tokens": self._calculate_cost(model_id, 10_000_000).monthly_estimate_usd,
-                "100M_tokens": self._calculate_cost(model_id, 100_000_000).monthly_estimate_usd,
+                label: _token_cost(input_price, output_price, tokens, 0.75)[2]
+                for label, tokens in _USAGE_TIERS
             },
             "note": f"Cost estimates assume {int(input_ratio*100)}:{int((1-input_ratio)*100)} input:output token ratio."
         }
@@ -1039,33 +1427,20 @@ class ModelScoutAnalyst:
         """
         Return current data status and freshness.
         """
-        models_with_benchmarks = list(self.benchmark_data.keys())
-        models_with_pricing = list(self.pricing_data.keys())
-        
-        # Check for incomplete data
-        warnings = []
-        for model in models_with_benchmarks:
-            bench = self.benchmark_data[model]
-            if not bench.get("arena_elo"):
-                warnings.append(f"{model}: Arena ELO unavailable")
-            if not bench.get("humaneval"):
-                warnings.append(f"{model}: HumanEval benchmark unavailable")
-        
-        for model in models_with_benchmarks:
-            if model not in models_with_pricing:
-                warnings.append(f"{model}: Pricing data unavailable")
+        # Incomplete-data warnings are collected whenever the data changes
+        warnings = self._data_warnings
         
         return {
             "data_freshness": self._get_data_freshness(),
             "benchmark_snapshot_date": self.data_timestamp,
             "models_tracked": {
-                "with_benchmarks": len(models_with_benchmarks),
-                "with_pricing": len(models_with_pricing),
-                "model_list": models_with_benchmarks
+                "with_benchmarks": len(self._benchmark_keys),
+                "with_pricing": len(self._pricing_keys),
+                "model_list": self._benchmark_keys
             },
             "data_completeness": {
                 "complete": len(warnings) == 0,
-                "warnings": warnings[:10],  # Limit to 10 warnings
+                "warnings": list(warnings[:10]),  # Limit to 10 warnings
                 "total_warnings": len(warnings)
             }
         }
@@ -1075,14 +1450,20 @@ class ModelScoutAnalyst:
 # SINGLETON INSTANCE
 # ============================================================================
 
-_analyst_instance = None
+# Guards creation and replacement of the singleton under threaded workers
+_analyst_lock = threading.Lock()
+_analyst_instance: Optional[ModelScoutAnalyst] = None
 
 def get_model_scout_analyst() -> ModelScoutAnalyst:
     """Get or create the ModelScoutAnalyst singleton."""
     global _analyst_instance
-    if _analyst_instance is None:
-        _analyst_instance = ModelScoutAnalyst()
-    return _analyst_instance
+    analyst = _analyst_instance
+    if analyst is not None:
+        return analyst
+    with _analyst_lock:
+        if _analyst_instance is None:
+            _analyst_instance = ModelScoutAnalyst()
+        return _analyst_instance
 
 
 def refresh_analyst(
@@ -1092,9 +1473,11 @@ def refresh_analyst(
 ) -> ModelScoutAnalyst:
     """Refresh the analyst with new data."""
     global _analyst_instance
-    _analyst_instance = ModelScoutAnalyst(
+    analyst = ModelScoutAnalyst(
         benchmark_data=benchmark_data,
         pricing_data=pricing_data,
         data_timestamp=timestamp
     )
-    return _analyst_instance
+    with _analyst_lock:
+        _analyst_instance = analyst
+    return analyst
@@ -10,7 +10,8 @@ This module provides:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, NamedTuple, Optional, Any, Union
+from types import MappingProxyType
 from datetime import datetime
 from enum import Enum
 import json
@@ -47,6 +48,86 @@ class ModelModality(Enum):
     MULTIMODAL = "multimodal"
 
 
+class _ScoutSpec(NamedTuple):
+    """One research agent in a modality's scout squad."""
+    name: str
+    url: str
+    prompt: str
+
+
+# Mino scouts run for each modality by recommend_stream(); prompts are formatted with use_case
+_SCOUT_SQUADS = MappingProxyType({
+    "image": (
+        _ScoutSpec(
+            "Quality Analyst",
+            "https://www.bing.com/search?q=best+image+generation+models+2025+benchmark+quality",
+            "Identify top 3 image models for '{use_case}'. focus on visual quality (FID, realism). Return JSON summary."
+        ),
+        _ScoutSpec(
+            "Pricing Analyst",
+            "https://www.bing.com/search?q=ai+image+generator+pricing+comparison+2025",
+            "Find pricing for top image models (Midjourney, DALL-E 3, Flux, Adobe Firefly). Cost per image? Subscription? Return JSON."
+        ),
+        _ScoutSpec(
+            "Review Analyst",
+            "https://www.bing.com/search?q=reddit+stable+diffusion+vs+midjourney+v6+review",
+            "Find user consensus on Midjourney vs Stable Diffusion vs Flux. Pros/Cons for '{use_case}'. Return JSON."
+        ),
+    ),
+    "video": (
+        _ScoutSpec(
+            "Motion Analyst",
+            "https://www.bing.com/search?q=best+ai+video+generator+2025+temporal+consistency",
+            "Identify top video models (Sora, Runway Gen-3, Pika, Luma). Focus on motion smoothness and consistency. Return JSON."
+        ),
+        _ScoutSpec(
+            "Tech Analyst",
+            "https://www.bing.com/search?q=ai+video+generation+max+duration+resolution+comparison",
+            "Compare specs: Max duration, Resolution (1080p/4K), FBS. Return JSON."
+        ),
+        _ScoutSpec(
+            "Pricing Analyst",
+            "https://www.bing.com/search?q=runway+ml+pricing+vs+pika+labs+subscription+cost",
+            "Find pricing models for Runway, Pika, Luma. Cost per second? Return JSON."
+        ),
+    ),
+    "voice": (
+        _ScoutSpec(
+            "Audio Analyst",
+            "https://www.bing.com/search?q=best+ai+voice+cloning+model+2025+quality",
+            "Identify top voice models (ElevenLabs, OpenAI, PlayHT). Focus on realism and cloning speed. Return JSON."
+        ),
+        _ScoutSpec(
+            "Feature Analyst",
+            "https://www.bing.com/search?q=elevenlabs+vs+playht+features+emotions+latency",
+            "Compare features: Emotional control, low latency (real-time), language support. Return JSON."
+        ),
+        _ScoutSpec(
+            "Cost Analyst",
+            "https://www.bing.com/search?q=ai+tts+pricing+comparison+per+character",
+            "Compare pricing for ElevenLabs, Azure, OpenAI. Cost per 1k chars? Return JSON."
+        ),
+    ),
+    "3d": (
+        _ScoutSpec(
+            "Mesh Analyst",
+            "https://www.bing.com/search?q=best+ai+3d+model+generator+2025+topology",
+            "Identify top 3D models (Meshy, Luma Genie, Rodin). Focus on mesh topology and UV quality. Return JSON."
+        ),
+        _ScoutSpec(
+            "Speed Analyst",
+            "https://www.bing.com/search?q=fastest+ai+3d+asset+generator+benchmark",
+            "Compare generation speed. Which tools are distinctively faster? Return JSON."
+        ),
+        _ScoutSpec(
+            "Integration Analyst",
+            "https://www.bing.com/search?q=ai+3d+model+generator+game+engine+workflow+compatibility",
+            "Check compatibility with Unity/Unreal/Blender. Export formats (GLB, OBJ, FBX). Return JSON."
+        ),
+    ),
+})
+
+
 # ============================================================================
 # MULTIMODAL ANALYST ENGINE
 # ============================================================================
@@ -364,82 +445,14 @@ Research the latest models and provide accurate, up-to-date information."""
         yield {"type": "log", "message": f"Initializing Functional Squad for {modality.upper()} recommendation..."}
         
         # 1. Define Scouts based on Modality
-        scouts = []
-        if modality == "image":
-            scouts = [
-                {
-                    "name": "Quality Analyst",
-                    "url": "https://www.bing.com/search?q=best+image+generation+models+2025+benchmark+quality",
-                    "prompt": f"Identify top 3 image models for '{use_case}'. focus on visual quality (FID, realism). Return JSON summary."
-                },
-                {
-                    "name": "Pricing Analyst",
-                    "url": "https://www.bing.com/search?q=ai+image+generator+pricing+comparison+2025",
-                    "prompt": f"Find pricing for top image models (Midjourney, DALL-E 3, Flux, Adobe Firefly). Cost per image? Subscription? Return JSON."
-                },
-                {
-                    "name": "Review Analyst",
-                    "url": "https://www.bing.com/search?q=reddit+stable+diffusion+vs+midjourney+v6+review",
-                    "prompt": f"Find user consensus on Midjourney vs Stable Diffusion vs Flux. Pros/Cons for '{use_case}'. Return JSON."
-                }
-            ]
-        elif modality == "video":
-            scouts = [
-                {
-                    "name": "Motion Analyst",
-                    "url": "https://www.bing.com/search?q=best+ai+video+generator+2025+temporal+consistency",
-                    "prompt": f"Identify top video models (Sora, Runway Gen-3, Pika, Luma). Focus on motion smoothness and consistency. Return JSON."
-                },
-                {
-                    "name": "Tech Analyst",
-                    "url": "https://www.bing.com/search?q=ai+video+generation+max+duration+resolution+comparison",
-                    "prompt": f"Compare specs: Max duration, Resolution (1080p/4K), FBS. Return JSON."
-                },
-                {
-                    "name": "Pricing Analyst",
-                    "url": "https://www.bing.com/search?q=runway+ml+pricing+vs+pika+labs+subscription+cost",
-                    "prompt": f"Find pricing models for Runway, Pika, Luma. Cost per second? Return JSON."
-                }
-            ]
-        elif modality == "voice":
-            scouts = [
-                {
-                    "name": "Audio Analyst",
-                    "url": "https://www.bing.com/search?q=best+ai+voice+cloning+model+2025+quality",
-                    "prompt": f"Identify top voice models (ElevenLabs, OpenAI, PlayHT). Focus on realism and cloning speed. Return JSON."
-                },
-                {
-                    "name": "Feature Analyst",
-                    "url": "https://www.bing.com/search?q=elevenlabs+vs+playht+features+emotions+latency",
-                    "prompt": f"Compare features: Emotional control, low latency (real-time), language support. Return JSON."
-                },
-                {
-                    "name": "Cost Analyst",
-                    "url": "https://www.bing.com/search?q=ai+tts+pricing+comparison+per+character",
-                    "prompt": f"Compare pricing for ElevenLabs, Azure, OpenAI. Cost per 1k chars? Return JSON."
-                }
-            ]
-        elif modality == "3d":
-            scouts = [
-                {
-                    "name": "Mesh Analyst",
-                    "url": "https://www.bing.com/search?q=best+ai+3d+model+generator+2025+topology",
-                    "prompt": f"Identify top 3D models (Meshy, Luma Genie, Rodin). Focus on mesh topology and UV quality. Return JSON."
-                },
-                {
-                    "name": "Speed Analyst",
-                    "url": "https://www.bing.com/search?q=fastest+ai+3d+asset+generator+benchmark",
-                    "prompt": f"Compare generation speed. Which tools are distinctively faster? Return JSON."
-                },
-                {
-                    "name": "Integration Analyst",
-                    "url": "https://www.bing.com/search?q=ai+3d+model+generator+game+engine+workflow+compatibility",
-                    "prompt": f"Check compatibility with Unity/Unreal/Blender. Export formats (GLB, OBJ, FBX). Return JSON."
-                }
-            ]
-        else:
+        squad = _SCOUT_SQUADS.get(modality)
+        if squad is None:
              yield {"type": "error", "message": f"Unsupported modality: {modality}"}
              return
+        scouts = [
+            {"name": scout.name, "url": scout.url, "prompt": scout.prompt.format(use_case=use_case)}
+            for scout in squad
+        ]
 
         scout_results = {}
         results_text = ""
@@ -545,7 +558,7 @@ Return ONLY valid JSON:
     
     def get_supported_modalities(self) -> List[str]:
         """Return list of supported modalities."""
-        return ["image", "video", "voice", "3d"]
+        return list(_SCOUT_SQUADS)
     
     def get_models_by_modality(self, modality: str) -> List[str]:
         """
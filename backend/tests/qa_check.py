@@ -3,12 +3,29 @@ import unittest
 import sys
 import os
 import json
+import sqlite3
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
 from unittest.mock import MagicMock, patch
 
 # Add backend to path
 sys.path.append(os.path.join(os.getcwd(), 'backend'))
 
-from phase2.mino_analyst import MinoAnalyst
+import database
+from phase2 import mino_analyst
+from phase2.mino_analyst import MinoAnalyst, MinoCache, MinoRecommendation
+from phase2 import model_scout_analyst
+from phase2.model_scout_analyst import ModelScoutAnalyst, UserRequirements
+
+try:
+    import flask
+    import orjson
+    HAS_FLASK = True
+except ImportError:
+    HAS_FLASK = False
 
 class TestMinoAnalystQA(unittest.TestCase):
     def setUp(self):
@@ -40,6 +57,43 @@ class TestMinoAnalystQA(unittest.TestCase):
         self.assertIn("Scout B", data)
         print("[QA] Parallel execution verified successfully.")
 
+    def test_parallel_scouts_cancelled_on_close(self):
+        """Verify queued scouts are cancelled when the stream is closed early."""
+        calls = []
+        release = threading.Event()
+        def slow_mino(prompt, url=None):
+            calls.append(prompt)
+            release.wait(2)
+            return "{}"
+        self.analyst._call_mino = slow_mino
+
+        with patch.object(mino_analyst, "_SCOUT_POOL", ThreadPoolExecutor(max_workers=1)) as pool:
+            stream = self.analyst._run_parallel_scouts([
+                {"name": "Scout A", "prompt": "Task A"},
+                {"name": "Scout B", "prompt": "Task B"}
+            ])
+            next(stream)
+            stream.close()
+            release.set()
+            pool.shutdown(wait=True)
+        self.assertEqual(calls, ["Task A"], "Scout B should never start after the client disconnects")
+
+    def test_parallel_scouts_keepalive(self):
+        """Verify a waiting stream emits keepalive logs instead of going silent."""
+        release = threading.Event()
+        def slow_mino(prompt, url=None):
+            release.wait(2)
+            return "{}"
+        self.analyst._call_mino = slow_mino
+
+        with patch.object(mino_analyst, "SCOUT_WAIT_TIMEOUT_SECONDS", 0.05):
+            stream = self.analyst._run_parallel_scouts([{"name": "Scout A", "prompt": "Task A"}])
+            next(stream)  # start log
+            self.assertIn("Waiting on 1 scout(s)", next(stream)["message"])
+            release.set()
+            events = list(stream)
+        self.assertEqual(events[-1]["type"], "internal_complete")
+
     def test_benchmark_stream_structure(self):
         """Verify the full stream structure."""
         print("\n[QA] Testing Benchmark Stream Flow...")
@@ -66,5 +120,217 @@ class TestMinoAnalystQA(unittest.TestCase):
         self.assertTrue(has_result, "Stream should yield a final result")
         print("[QA] Benchmark stream flow verified.")
 
+    def test_recommendation_from_dict_validation(self):
+        """Verify Mino payloads are coerced once into a typed recommendation."""
+        rec = MinoRecommendation.from_dict({
+            "recommended_model": "GPT-4o",
+            "cost_per_1m_input": "5.00",
+            "cost_per_1m_output": 15,
+            "estimated_monthly_cost": "$42.50",
+            "within_budget": "false",
+            "advantages": "not a list"
+        })
+        self.assertEqual(rec.provider, "Unknown")
+        self.assertAlmostEqual(rec.cost_per_1k_input, 0.005)
+        self.assertAlmostEqual(rec.cost_per_1k_output, 0.015)
+        self.assertAlmostEqual(rec.estimated_monthly_cost, 42.5)
+        self.assertFalse(rec.within_budget)
+        self.assertEqual(rec.advantages, [])
+        
+        with self.assertRaises(ValueError):
+            MinoRecommendation.from_dict(["not", "an", "object"])
+
+    def test_modality_detection_and_validation(self):
+        """Verify keyword priorities for modality detection and model-name validation."""
+        self.assertEqual(self.analyst._detect_modality("Turn product photos into a video"), "video")
+        self.assertEqual(self.analyst._detect_modality("Generate marketing art"), "image")
+        self.assertEqual(self.analyst._detect_modality("Podcast narration"), "voice")
+        self.assertEqual(self.analyst._detect_modality("Create 3D game assets"), "3d")
+        self.assertEqual(self.analyst._detect_modality("Unity game dialogue"), "text")
+        self.assertEqual(self.analyst._detect_modality("Customer support chatbot"), "text")
+        
+        self.assertTrue(self.analyst._validate_model_modality("GPT-4o", "text"))
+        self.assertFalse(self.analyst._validate_model_modality("Stable-Diffusion XL", "text"))
+        self.assertTrue(self.analyst._validate_model_modality("Stable-Diffusion XL", "image"))
+        self.assertTrue(self.analyst._validate_model_modality("Meshy-4", "3d"))
+        self.assertFalse(self.analyst._validate_model_modality("Sora", "voice"))
+
+    def test_recommendation_cache(self):
+        """Verify validated recommendations are served from cache and fallbacks are not cached."""
+        self.analyst._call_mino = MagicMock(return_value='{"recommended_model": "GPT-4o", "provider": "OpenAI"}')
+        first = self.analyst.recommend("Customer support chatbot", {"cost": "high"}, 100, 5_000_000)
+        second = self.analyst.recommend("  customer SUPPORT chatbot ", {"cost": "high"}, 100.2, 5_050_000)
+        self.assertEqual(first.recommended_model, "GPT-4o")
+        self.assertIs(first, second)
+        self.assertEqual(self.analyst._call_mino.call_count, 1)
+        # Shared between callers, so cached recommendations must be immutable
+        with self.assertRaises(AttributeError):
+            first.recommended_model = "Other"
+        # Budget and usage straight from JSON may be strings
+        self.assertIs(self.analyst.recommend("Customer support chatbot", {"cost": "high"}, "100", "5000000"), first)
+        
+        # Fails modality validation -> fallback, which must not be cached
+        self.analyst._call_mino = MagicMock(return_value='{"recommended_model": "Stable Diffusion XL"}')
+        self.analyst.recommend("Legal summarizer", {}, 50, 1_000_000)
+        self.assertEqual(len(self.analyst._rec_cache), 1)
+
+    def test_mino_response_cache(self):
+        """Verify repeated Mino prompts are served from the LRU response cache."""
+        cache = MinoCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"), "Least recently used entry should be evicted")
+        self.assertEqual(cache.get("a"), 1)
+        
+        del self.analyst._call_mino  # use the real method, mock the transport instead
+        self.analyst._call_mino_iter = MagicMock(side_effect=lambda *a, **k: iter([{"type": "result", "data": "{}"}]))
+        self.assertEqual(self.analyst._call_mino("prompt", url="https://example.com"), "{}")
+        self.assertEqual(self.analyst._call_mino("prompt", url="https://example.com"), "{}")
+        self.analyst._call_mino("prompt", url="https://example.org")
+        self.assertEqual(self.analyst._call_mino_iter.call_count, 2)
+        
+        self.assertEqual(self.analyst.invalidate("PROMPT"), 2)
+        self.analyst._call_mino("prompt", url="https://example.com")
+        self.assertEqual(self.analyst._call_mino_iter.call_count, 3)
+        
+        # Non-JSON bodies are returned but not cached
+        self.analyst._call_mino_iter = MagicMock(side_effect=lambda *a, **k: iter([{"type": "result", "data": "<html>Bad Gateway</html>"}]))
+        self.assertEqual(self.analyst._call_mino("other", url="https://example.com"), "<html>Bad Gateway</html>")
+        self.analyst._call_mino("other", url="https://example.com")
+        self.assertEqual(self.analyst._call_mino_iter.call_count, 2)
+        
+        # JSON callers parse each fresh response once and cache it only if that succeeds
+        self.assertIsNone(self.analyst._call_mino_json("other", url="https://example.com"))
+        self.assertEqual(self.analyst._call_mino_iter.call_count, 3)
+        self.analyst._call_mino_iter = MagicMock(side_effect=lambda *a, **k: iter([{"type": "result", "data": '{"a": 1}'}]))
+        with patch.object(self.analyst, "_extract_json", wraps=self.analyst._extract_json) as parse:
+            self.assertEqual(self.analyst._call_mino_json("json"), {"a": 1})
+            self.assertEqual(parse.call_count, 1)
+        self.assertEqual(self.analyst._call_mino_json("json"), {"a": 1})
+        self.assertEqual(self.analyst._call_mino_iter.call_count, 1)
+        
+        expiring = MinoCache(4, ttl=0)
+        expiring.put("k", "v")
+        self.assertIsNone(expiring.get("k"), "Entries past their TTL should be dropped")
+
+    def test_extract_json_fallbacks(self):
+        """Verify JSON is recovered from fenced, prose-wrapped and invalid responses."""
+        self.assertEqual(self.analyst._extract_json('```json\n{"a": 1}\n```'), {"a": 1})
+        self.assertEqual(
+            self.analyst._extract_json('Here you go: {"a": "x}y", "b": {"c": 2}} Hope it helps!'),
+            {"a": "x}y", "b": {"c": 2}}
+        )
+        self.assertIsNone(self.analyst._extract_json("no json here"))
+        self.assertIsNone(self.analyst._extract_json("[1, 2, 3]"))
+
+class TestModelScoutAnalystQA(unittest.TestCase):
+    def test_recommend_cache_tracks_db_snapshot(self):
+        """Verify recommendations are cached until refresh_data loads a different snapshot."""
+        snapshot = {"gpt-4o": {"lmsys_arena": {"arena_elo": 1300}}}
+        with patch.object(model_scout_analyst, "get_all_latest_benchmarks", lambda: json.loads(json.dumps(snapshot))), \
+             patch.object(model_scout_analyst, "DATABASE_AVAILABLE", True):
+            analyst = ModelScoutAnalyst(benchmark_data=json.loads(json.dumps(model_scout_analyst.MODEL_BENCHMARKS)))
+            first = analyst.recommend(UserRequirements("coding assistant", {"quality": "high"}, 50, 5_000_000))
+            second = analyst.recommend(UserRequirements("coding assistant", {"quality": "high"}, 50, 5_000_000))
+            self.assertIs(first, second)
+            
+            analyst.refresh_data()  # same snapshot
+            self.assertIs(analyst.recommend(UserRequirements("coding assistant", {"quality": "high"}, 50, 5_000_000)), first)
+            
+            snapshot["gpt-4o"]["lmsys_arena"]["arena_elo"] = 1000
+            analyst.refresh_data()
+            self.assertIsNot(analyst.recommend(UserRequirements("coding assistant", {"quality": "high"}, 50, 5_000_000)), first)
+
+    def test_cost_breakdown_cache(self):
+        """Verify repeated cost breakdowns reuse the memoized estimate."""
+        with patch.object(model_scout_analyst, "DATABASE_AVAILABLE", False):
+            analyst = ModelScoutAnalyst()
+        first = analyst.get_cost_breakdown("gpt-4o", 2_000_000)
+        second = analyst.get_cost_breakdown("gpt-4o", 2_000_000)
+        self.assertEqual(first, second)
+        self.assertAlmostEqual(first["cost_estimate"]["monthly_estimate_usd"], 15.0)
+        self.assertEqual(analyst._cost_cached.cache_info().hits, 1)
+
+    def test_latest_benchmarks_per_source(self):
+        """Verify only the newest timestamped row per (model, source) is returned."""
+        with tempfile.TemporaryDirectory() as tmp, \
+             patch.object(database, "DATABASE_PATH", os.path.join(tmp, "qa.db")):
+            database.init_database()
+            conn = sqlite3.connect(database.DATABASE_PATH)
+            conn.executemany(
+                "INSERT INTO benchmark_results (model_name, source, rank, average_score, benchmark_metrics, scraped_at) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    ("gpt-4o", "lmsys_arena", 2, 80.0, '{"arena_elo": 1280}', "2026-01-01 00:00:00"),
+                    ("gpt-4o", "lmsys_arena", 1, 90.0, '{"arena_elo": 1300}', "2026-01-02 00:00:00"),
+                    ("gpt-4o", "lmsys_arena", 3, 70.0, '{"arena_elo": 1000}', None),
+                    ("gpt-4o", "artificial_analysis", None, None, "{}", "2026-01-01 00:00:00"),
+                    ("llama-3", "lmsys_arena", 5, None, "not json", "2026-01-03 00:00:00")
+                ]
+            )
+            conn.commit()
+            conn.close()
+            self.assertEqual(database.get_all_latest_benchmarks(), {
+                "gpt-4o": {
+                    "lmsys_arena": {"arena_elo": 1300, "average_score": 90.0, "rank": 1},
+                    "artificial_analysis": {}
+                },
+                "llama-3": {"lmsys_arena": {"rank": 5}}
+            })
+
+    def test_singleton_refresh(self):
+        """Verify concurrent getters share one analyst and refresh_analyst swaps it."""
+        with patch.object(model_scout_analyst, "DATABASE_AVAILABLE", False), \
+             patch.object(model_scout_analyst, "_analyst_instance", None):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                seen = set(map(id, pool.map(lambda _: model_scout_analyst.get_model_scout_analyst(), range(16))))
+            self.assertEqual(len(seen), 1)
+            
+            refreshed = model_scout_analyst.refresh_analyst(timestamp="2026-01-01T00:00:00")
+            self.assertIs(model_scout_analyst.get_model_scout_analyst(), refreshed)
+
+@unittest.skipUnless(HAS_FLASK, "flask and orjson are required")
+class TestJsonProviderQA(unittest.TestCase):
+    def test_orjson_provider_matches_stdlib(self):
+        """Verify jsonify() through orjson matches Flask's stdlib provider."""
+        from flask.json.provider import DefaultJSONProvider
+        import app as app_module
+        
+        @dataclass
+        class Point:
+            x: int
+            y: float
+        
+        flask_app = app_module.app
+        self.assertIsInstance(flask_app.json, app_module.OrjsonProvider)
+        stdlib = DefaultJSONProvider(flask_app)
+        payload = {
+            "model": "gpt-4o",
+            "scores": [1, 2.5, None, True],
+            "nested": {"b": 2, "a": 1},
+            "updated_at": datetime(2026, 1, 2, 3, 4, 5),
+            "day": date(2026, 1, 2),
+            "point": Point(1, 2.5)
+        }
+        # Fall back to the stdlib encoder: \u-escaped text and integers past 64 bits
+        fallbacks = [
+            {"model": "Qwen-2.5 \u2014 \u901a\u4e49\u5343\u95ee", "use_case": "r\u00e9sum\u00e9 screening \U0001f680"},
+            {"tokens": 2 ** 70, "negative": -(2 ** 64)}
+        ]
+        debug = flask_app.debug
+        try:
+            for flask_app.debug in (False, True):  # debug responses are indented
+                for obj in [payload] + fallbacks:
+                    self.assertEqual(flask_app.json.response(obj).get_data(), stdlib.response(obj).get_data())
+                # Floats may be spelled differently but must decode to the same values
+                prices = {"per_token": 1.5e-05, "big": 1e16, "tiny": 5e-324}
+                self.assertEqual(
+                    json.loads(flask_app.json.response(prices).get_data()),
+                    json.loads(stdlib.response(prices).get_data())
+                )
+        finally:
+            flask_app.debug = debug
+
 if __name__ == '__main__':
     unittest.main()